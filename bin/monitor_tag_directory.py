@@ -2,8 +2,14 @@
 
 import os
 import time
-import glob
+import fnmatch
+import select
+import signal
+import struct
+import ctypes
 import datetime
+import queue
+import threading
 import smtplib
 import re
 from email.mime.text import MIMEText
@@ -15,10 +21,154 @@ from email.utils import formataddr
 MONITOR_DIR = "/dev/shm"
 # The file pattern to look for
 FILE_PATTERN = "*.tag"
-# How often (in seconds) to check the directory
+# How often (in seconds) to wake up and re-check pending files when idle
 POLL_INTERVAL_SECONDS = 5
+# How long (in seconds) no new file must arrive before the report is sent
+DEBOUNCE_SECONDS = 300
+# Outlook SMTP server settings
+SMTP_SERVER = "smtp.office365.com"
+SMTP_PORT = 587
+# How long (in seconds) to wait on the SMTP server before giving up on the session
+SMTP_TIMEOUT_SECONDS = 30
+# Report sender and recipient
+SENDER_EMAIL = "from@from.com"
+SENDER_PASSWORD = "XXXXXXXXXXX"
+RECIPIENT_EMAIL = "to@to.com"
+# How many times to try sending a report, and the first retry delay (doubles every retry)
+EMAIL_RETRIES = 5
+EMAIL_RETRY_DELAY_SECONDS = 5
+# How long (in seconds) to wait for queued reports to go out on shutdown
+EMAIL_SHUTDOWN_TIMEOUT_SECONDS = 30
 # ---------------------
 
+# inotify constants (see inotify(7))
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+# struct inotify_event { int wd; uint32_t mask; uint32_t cookie; uint32_t len; char name[]; }
+INOTIFY_EVENT = struct.Struct("iIII")
+
+_libc = ctypes.CDLL(None, use_errno=True)
+
+# eventfd used to wake the monitor loop up for a clean shutdown
+_stop_fd = None
+
+# SMTP session kept open across retries and reports, owned by the email worker
+_smtp = None
+
+# Reports waiting to be sent by the email worker
+_email_queue = queue.Queue(maxsize=16)
+
+# Regex to find anything enclosed in < and >
+HTML_TAG_RE = re.compile(r'<[^>]*>')
+
+# Report email templates
+HEADER_HTML = """
+<html>
+<body>
+  <table cellspacing="0" cellpadding="5" border="5" width="600" style="width: 600px; border-collapse: collapse; border: 5px solid #cccccc;">
+    <tr><td colspan="2" style="background-color: #0b4f8a; color: #ffffff; padding: 10px; font-family: Arial, sans-serif; font-size: 16px; text-align: center; border: 5px solid #cccccc;"><b>AEI Tag Report</b></td></tr>
+    <tr>
+      <th width="50%" style="width: 50%; background-color: #337ab7; color: #ffffff; padding: 10px; font-family: Arial, sans-serif; font-size: 16px; text-align: left; border: 5px solid #cccccc;">Date and Time</th>
+      <th width="50%" style="width: 50%; background-color: #337ab7; color: #ffffff; padding: 10px; font-family: Arial, sans-serif; font-size: 16px; text-align: left; border: 5px solid #cccccc;">AEI Tag</th>
+    </tr>
+"""
+
+ROW_HTML = "<tr><td style=\"padding: 10px; font-family: Arial, sans-serif; font-size: 14px; color: #333333; border: 5px solid #cccccc;\">{string_time}</td><td style=\"padding: 10px; font-family: Arial, sans-serif; font-size: 14px; color: #333333; border: 5px solid #cccccc;\">{tag}</td></tr>"
+
+FOOTER_HTML = """
+    <tr><td colspan="2" style="background-color: #eeeeee; color: #000000; padding: 10px; font-family: Arial, sans-serif; font-size: 12px; text-align: center; border: 5px solid #cccccc;">&copy; 2025 LUCEON LLC. Generated on {string_time}. Tag count: {total_tags}.</td></tr>
+  </table>
+</body>
+</html>
+"""
+
+def inotify_init(flags=0):
+    """
+    Creates a new inotify instance.
+
+    :param flags: IN_NONBLOCK and/or IN_CLOEXEC.
+    :return: The inotify file descriptor.
+    """
+    fd = _libc.inotify_init1(flags)
+    if fd < 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno))
+    return fd
+
+def inotify_add_watch(fd, path, mask):
+    """
+    Adds a watch for the given path to an inotify instance.
+
+    :param fd: The inotify file descriptor.
+    :param path: The directory to watch.
+    :param mask: The events to watch for.
+    :return: The watch descriptor.
+    """
+    wd = _libc.inotify_add_watch(fd, os.fsencode(path), mask)
+    if wd < 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno), path)
+    return wd
+
+def read_inotify_events(fd):
+    """
+    Drains all pending events from a non-blocking inotify descriptor.
+
+    :param fd: The inotify file descriptor.
+    :return: A tuple of (list of file names reported, True if the event queue overflowed).
+    """
+    names = []
+    overflow = False
+
+    while True:
+        try:
+            data = os.read(fd, 4096)
+        except BlockingIOError:
+            break
+
+        offset = 0
+        while offset < len(data):
+            wd, mask, cookie, length = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                overflow = True
+            elif name:
+                names.append(os.fsdecode(name))
+
+    return names, overflow
+
+def scan_directory():
+    """
+    Lists the files in the monitored directory that match the pattern.
+
+    :return: A dict mapping each file path to its creation time.
+    """
+    entries = {}
+
+    with os.scandir(MONITOR_DIR) as it:
+        for entry in it:
+            if fnmatch.fnmatch(entry.name, FILE_PATTERN):
+                try:
+                    entries[entry.path] = entry.stat().st_ctime
+                except FileNotFoundError:
+                    pass
+
+    return entries
+
+def stop_monitor(signum=None, frame=None):
+    """
+    Wakes the monitor loop up and asks it to exit. Safe to use as a signal handler.
+    """
+    if _stop_fd is not None:
+        os.eventfd_write(_stop_fd, 1)
+
 def process_tag_file(filepath):
     """
     Reads the content of a file into a variable and then deletes the file.
@@ -31,21 +181,25 @@ def process_tag_file(filepath):
 
     try:
         # 1. Read the contents into a variable
-        with open(filepath, 'r') as f:
-            file_content = f.read()
+        # Tag files are a few bytes on tmpfs, so a single raw read is enough
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            file_content = os.read(fd, 4096).decode()
+        finally:
+            os.close(fd)
 
     except FileNotFoundError:
-        # Handle the unlikely case where the file is deleted between glob and open
+        # Handle the unlikely case where the file is deleted between scan and open
         print(f"Error: File not found during reading (might have been deleted): {filepath}")
         return None
-    except IOError as e:
+    except (OSError, UnicodeDecodeError) as e:
         print(f"Error reading file {filepath}: {e}")
         return None
 
     # 2. Delete the file after processing
     # Note: It's important to delete the file to prevent reprocessing it on the next loop iteration.
     try:
-        os.remove(filepath)
+        os.unlink(filepath)
         print(f"Successfully deleted file: {filepath}")
     except OSError as e:
         print(f"Error deleting file {filepath}: {e}")
@@ -56,95 +210,130 @@ def monitor_directory():
     """
     The main monitoring loop.
     """
+    global _stop_fd
+
     print(f"Starting directory monitor...")
     print(f"Target Directory: {MONITOR_DIR}")
     print(f"Looking for files: {FILE_PATTERN}")
     print(f"Poll Interval: {POLL_INTERVAL_SECONDS} seconds")
+    print(f"Debounce: {DEBOUNCE_SECONDS} seconds")
     print("-" * 50)
 
-    # Main loop that runs indefinitely
-    while True:
-        # Construct the full search path
-        search_path = os.path.join(MONITOR_DIR, FILE_PATTERN)
+    # Get notified by the kernel when a file is written or moved into the directory
+    inotify_fd = inotify_init(IN_NONBLOCK | IN_CLOEXEC)
+    inotify_add_watch(inotify_fd, MONITOR_DIR, IN_CLOSE_WRITE | IN_MOVED_TO | IN_Q_OVERFLOW)
+    _stop_fd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
 
-        # Use glob to find all files matching the pattern
-        tag_files = glob.glob(search_path)
+    poller = select.epoll()
+    poller.register(inotify_fd, select.EPOLLIN)
+    poller.register(_stop_fd, select.EPOLLIN)
 
-        if tag_files:
-            print(f"\n[SCAN] Found {len(tag_files)} new .tag file(s) to process.")
+    # Emails are sent from a separate thread so SMTP never blocks the loop
+    worker = threading.Thread(target=email_worker, name="email-worker", daemon=True)
+    worker.start()
 
-            # Files will be emitted if all are older than X
-            emit = False
+    # Pick up any files that were left behind before we started watching
+    # Maps each pending file to its creation time, stat()-ed only once
+    pending = scan_directory()
 
-            # Process each found file
-            for file_path in tag_files:
-                # Get file's creation time
-                creation_timestamp = os.path.getctime(file_path)
+    # When the last file arrived; leftovers count from their own creation time
+    last_event_time = max(pending.values(), default=0)
 
-                if (time.time() - creation_timestamp) < 300:
-                    emit = False
+    try:
+        # Main loop that runs indefinitely
+        while True:
+            events = poller.poll(POLL_INTERVAL_SECONDS)
+
+            if any(fd == _stop_fd for fd, _ in events):
+                print("[STOP] Shutdown requested. Exiting monitor loop.")
+                break
+
+            if events:
+                names, overflow = read_inotify_events(inotify_fd)
+
+                if overflow:
+                    # Some events were lost, resync with a single directory scan
+                    print("[SCAN] inotify queue overflowed. Rescanning directory.")
+                    pending = scan_directory()
+                    last_event_time = time.time()
                 else:
-                    emit = True
+                    for name in names:
+                        if not fnmatch.fnmatch(name, FILE_PATTERN):
+                            continue
+
+                        file_path = os.path.join(MONITOR_DIR, name)
+
+                        try:
+                            pending[file_path] = os.stat(file_path).st_ctime
+                        except FileNotFoundError:
+                            # Already gone, nothing to report
+                            continue
+
+                        last_event_time = time.time()
+
+            if not pending:
+                if not events:
+                    print(f"[SCAN] No {FILE_PATTERN} files found. Waiting...")
+                continue
 
+            entries = sorted(pending.items())
 
-            # All files are older
+            print(f"\n[SCAN] Found {len(entries)} new .tag file(s) to process.")
+
+            # Files are emitted once no new file has arrived for the debounce window
+            emit = (time.time() - last_event_time) > DEBOUNCE_SECONDS
+
+            # The burst is over
             # Assemble a message and send it out
             if emit:
-                body = """
-                <html>
-                <body>
-                  <table cellspacing="0" cellpadding="5" border="5" width="600" style="width: 600px; border-collapse: collapse; border: 5px solid #cccccc;">
-                    <tr><td colspan="2" style="background-color: #0b4f8a; color: #ffffff; padding: 10px; font-family: Arial, sans-serif; font-size: 16px; text-align: center; border: 5px solid #cccccc;"><b>AEI Tag Report</b></td></tr>
-                    <tr>
-                      <th width="50%" style="width: 50%; background-color: #337ab7; color: #ffffff; padding: 10px; font-family: Arial, sans-serif; font-size: 16px; text-align: left; border: 5px solid #cccccc;">Date and Time</th>
-                      <th width="50%" style="width: 50%; background-color: #337ab7; color: #ffffff; padding: 10px; font-family: Arial, sans-serif; font-size: 16px; text-align: left; border: 5px solid #cccccc;">AEI Tag</th>
-                    </tr>
-                """
-
+                parts = [HEADER_HTML]
                 total_tags = 0
                 string_time = ''
 
-                for file_path in tag_files:
+                for file_path, creation_timestamp in entries:
 
                     # The file content is read and stored here,
                     # though we only print it in this example.
-                    creation_timestamp = os.path.getctime(file_path)
                     processed_content = process_tag_file(file_path)
                     string_time = datetime.datetime.fromtimestamp(creation_timestamp).strftime('%Y-%m-%d %H:%M:%S')
 
                     # You can use the 'processed_content' variable here if needed,
                     # e.g., send it to a database or trigger another action.
                     if processed_content is not None:
-                        # Example of using the content variable (just printing type/length)
-                        body += f"<tr><td style=\"padding: 10px; font-family: Arial, sans-serif; font-size: 14px; color: #333333; border: 5px solid #cccccc;\">{string_time}</td><td style=\"padding: 10px; font-family: Arial, sans-serif; font-size: 14px; color: #333333; border: 5px solid #cccccc;\">{processed_content}</td></tr>"
+                        parts.append(ROW_HTML.format(string_time=string_time, tag=processed_content))
                         total_tags += 1
 
-                body += f"""
-                    <tr><td colspan="2" style="background-color: #eeeeee; color: #000000; padding: 10px; font-family: Arial, sans-serif; font-size: 12px; text-align: center; border: 5px solid #cccccc;">&copy; 2025 LUCEON LLC. Generated on {string_time}. Tag count: {total_tags}.</td></tr>
-                  </table>
-                </body>
-                </html>
-                """
+                parts.append(FOOTER_HTML.format(string_time=string_time, total_tags=total_tags))
+                body = "".join(parts)
 
                 print(body)
 
-                # Send email out
-                for i in range(5):
-                    now = datetime.datetime.now()
-                    string_time = now.strftime("%Y-%m-%d %H:%M")
-                    sent = send_outlook_email("from@from.com", "XXXXXXXXXXX", "to@to.com", f"AEI Tag Report: {string_time}", strip_html_tags_regex(body), body)
-
-                    if sent:
-                        break
-
-                    time.sleep(10*i)
-
-
+                # Hand the email over to the worker, retries happen over there
+                now = datetime.datetime.now()
+                string_time = now.strftime("%Y-%m-%d %H:%M")
+                try:
+                    _email_queue.put_nowait((f"AEI Tag Report: {string_time}", body))
+                except queue.Full:
+                    # Never block the monitor loop on a stalled worker
+                    print(f"\nERROR: Email queue is full, dropping 'AEI Tag Report: {string_time}'.")
+
+                # Forget the files that were just reported
+                for file_path, _ in entries:
+                    pending.pop(file_path, None)
+
+    finally:
+        # Let the worker flush what is queued, then log out of the SMTP server
+        try:
+            _email_queue.put_nowait(None)
+        except queue.Full:
+            print("\nERROR: Email queue is full, not waiting for the email worker.")
         else:
-            print(f"[SCAN] No {FILE_PATTERN} files found. Waiting...")
+            worker.join(EMAIL_SHUTDOWN_TIMEOUT_SECONDS)
 
-        # Wait before checking the directory again
-        time.sleep(POLL_INTERVAL_SECONDS)
+        poller.close()
+        os.close(inotify_fd)
+        os.close(_stop_fd)
+        _stop_fd = None
 
 def strip_html_tags_regex(html_string: str) -> str:
     """
@@ -156,27 +345,113 @@ def strip_html_tags_regex(html_string: str) -> str:
     :param html_string: The input string potentially containing HTML tags.
     :return: The string with HTML tags removed.
     """
-    # Regex to find anything enclosed in < and >
-    clean = re.compile('<.*?>')
-    return re.sub(clean, '', html_string)
+    return HTML_TAG_RE.sub('', html_string)
 
-def send_outlook_email(sender_email, sender_password, recipient_email, subject, body_text, body_html=None):
+def email_worker():
     """
-    Sends an email using Outlook.com / Office 365 SMTP servers.
+    Sends the queued reports one at a time, retrying failed sends with an
+    exponential backoff. Runs on its own thread and owns the SMTP session;
+    a None item tells it to close the session and exit.
+    """
+    while True:
+        item = _email_queue.get()
+
+        if item is None:
+            break
+
+        subject, body_html = item
+
+        for i in range(EMAIL_RETRIES):
+            server = get_smtp()
+            sent = server is not None and send_outlook_email(server, SENDER_EMAIL, RECIPIENT_EMAIL, subject, strip_html_tags_regex(body_html), body_html)
+
+            if sent:
+                break
+
+            if i < EMAIL_RETRIES - 1:
+                delay = EMAIL_RETRY_DELAY_SECONDS * (2 ** i)
+                print(f"Retrying in {delay} seconds...")
+                time.sleep(delay)
+        else:
+            print(f"\nERROR: Giving up on '{subject}' after {EMAIL_RETRIES} attempts.")
+
+    close_smtp()
+
+def get_smtp():
+    """
+    Returns a connected and authenticated SMTP session for the Outlook.com /
+    Office 365 servers. The previous session is reused as long as it still
+    answers a NOOP, otherwise a new one is established.
+
+    :return: The smtplib.SMTP object or None if the connection failed.
+    """
+    global _smtp
+
+    # Health check the existing session
+    if _smtp is not None:
+        try:
+            if _smtp.noop()[0] == 250:
+                return _smtp
+        except Exception:
+            pass
+
+        print("SMTP session is no longer usable. Reconnecting...")
+        close_smtp()
+
+    try:
+        # Connect to the server
+        print(f"Connecting to {SMTP_SERVER}...")
+        server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT, timeout=SMTP_TIMEOUT_SECONDS)
+
+        # Secure the connection
+        server.starttls()
+
+        # Login
+        print("Logging in...")
+        server.login(SENDER_EMAIL, SENDER_PASSWORD)
+
+    except smtplib.SMTPAuthenticationError:
+        print("\nERROR: Authentication failed.")
+        print("If you have 2FA enabled, you MUST use an 'App Password'.")
+        print("Check your Microsoft Account -> Security -> Advanced Security Options.")
+        return None
+    except Exception as e:
+        print(f"\nERROR: Could not connect to {SMTP_SERVER}: {e}")
+        return None
+
+    _smtp = server
+    return _smtp
+
+def close_smtp():
+    """
+    Closes the shared SMTP session, if any.
+    """
+    global _smtp
+
+    if _smtp is None:
+        return
+
+    try:
+        _smtp.quit()
+    except Exception:
+        _smtp.close()
+
+    _smtp = None
+
+def send_outlook_email(server, sender_email, recipient_email, subject, body_text, body_html=None):
+    """
+    Sends an email over an already connected SMTP session (see get_smtp).
+    The session is left open so it can be reused for the next email.
 
     Args:
+        server (smtplib.SMTP): The connected and authenticated SMTP session.
         sender_email (str): Your Outlook/Hotmail/Live email address.
-        sender_password (str): Your App Password (recommended) or login password.
         recipient_email (str): The email address of the receiver.
         subject (str): The subject line of the email.
         body_text (str): The plain text body of the email.
         body_html (str, optional): The HTML body of the email. Defaults to None.
     """
 
-    # Outlook SMTP server settings
-    smtp_server = "smtp.office365.com"
-    smtp_port = 587
-
     # Create the email object
     msg = MIMEMultipart('alternative')
     msg['From'] = sender_email
@@ -191,31 +466,13 @@ def send_outlook_email(sender_email, sender_password, recipient_email, subject,
         msg.attach(MIMEText(body_html, 'html'))
 
     try:
-        # Connect to the server
-        print(f"Connecting to {smtp_server}...")
-        server = smtplib.SMTP(smtp_server, smtp_port)
-
-        # Secure the connection
-        server.starttls()
-
-        # Login
-        print("Logging in...")
-        server.login(sender_email, sender_password)
-
         # Send the email
         print(f"Sending email to {recipient_email}...")
         server.send_message(msg)
 
-        # Disconnect
-        server.quit()
         print("Email sent successfully!")
         return True
 
-    except smtplib.SMTPAuthenticationError:
-        print("\nERROR: Authentication failed.")
-        print("If you have 2FA enabled, you MUST use an 'App Password'.")
-        print("Check your Microsoft Account -> Security -> Advanced Security Options.")
-        return False
     except Exception as e:
         print(f"\nERROR: An error occurred: {e}")
         return False
@@ -229,6 +486,9 @@ if __name__ == "__main__":
         print(f"Error: The directory {MONITOR_DIR} does not exist or is inaccessible.")
         exit(1)
 
+    # Exit the monitor loop cleanly when systemd stops the service
+    signal.signal(signal.SIGTERM, stop_monitor)
+
     try:
         monitor_directory()
     except KeyboardInterrupt:
@@ -7,6 +7,35 @@ from datetime import datetime
 import re
 import subprocess
 import os
+import atexit
+import queue
+import threading
+from functools import lru_cache
+from collections import OrderedDict
+
+# Every reader frame ends with this byte
+FRAME_END = b'\xF5'
+# How long (in seconds) to wait for a complete frame from the reader
+READ_TIMEOUT_SECONDS = 1.0
+# Incomplete frame data longer than this is garbage and gets dropped
+MAX_FRAME_BYTES = 256
+# How often (in seconds) to check the reader status while no tags are read
+STATUS_INTERVAL_SECONDS = 10
+# First and longest delay (in seconds) between attempts to reopen a lost reader
+RECONNECT_INITIAL_DELAY_SECONDS = 0.5
+RECONNECT_MAX_DELAY_SECONDS = 5.0
+# Every tag read is appended here
+TAGS_LOG_PATH = "/tmp/tags.log"
+# New tags are dropped here for the directory monitor to pick up
+TAG_DIR = "/dev/shm"
+# Repeat reads of the same tag within this many seconds are not stored again
+DEDUP_WINDOW_SECONDS = 5.0
+# Tags not read for this many seconds are forgotten by the deduplication
+DEDUP_FORGET_SECONDS = 60.0
+# How many raw reads may wait for decoding before the reader is held back
+READ_QUEUE_SIZE = 256
+# A tag read frame, the captured group is the 6-bit encoded tag data
+TAG_PACKET_RE = re.compile(b'\xFA\x00\x07(.*?)\xF5', re.DOTALL)
 
 ###############################################################################
 ## FUNCTIONS
@@ -66,19 +95,54 @@ def send_binary_to_serial(port, binary_data):
 		try:
 			bytes_written = port.write(binary_data)
 			logger(f"\033[90mSuccessfully wrote {bytes_written} bytes.\033[0m")
-			time.sleep(0.1)
 		except serial.SerialException as write_error:
 			logger(f"\033[91mError during write/read: {write_error}\033[0m")
 		except Exception as e:
 			logger(f"\033[91mAn unexpected error occurred during write/read: {e}\033[0m")
 
+def read_frame(port, remainder=b''):
+	"""
+	Reads up to the next FRAME_END. pyserial applies the timeout to the
+	whole read_until() call, so a frame arriving across the timeout comes
+	back cut in two. The incomplete part is handed back so it can be
+	passed in again and completed by the next read.
+
+	Args:
+		port: The open serial port.
+		remainder: Incomplete frame data left over from the previous read.
+
+	Returns:
+		A tuple of (complete frame or b'', incomplete data to keep).
+	"""
+	received_data = remainder + port.read_until(FRAME_END)
+
+	if received_data.endswith(FRAME_END):
+		return received_data, b''
+
+	return b'', received_data
+
+def read_reply(port):
+	"""
+	Reads the reader's reply to a command, giving a reply cut short by the
+	read timeout one more read to complete.
+
+	Returns:
+		The reply, or whatever incomplete data arrived.
+	"""
+	received_data, remainder = read_frame(port)
+
+	if remainder:
+		received_data, remainder = read_frame(port, remainder)
+
+	return received_data or remainder
+
 def get_reader_status(port):
 	logger(f"\033[92mGetting reader status.\033[0m")
 	send_binary_to_serial(port=port, binary_data=b'\xFA\x00\x06\x7A\xF5')
-	received_data = port.read_all()
+	received_data = read_reply(port)
 	logger(f"\033[90mReceived data: {received_data.hex()} ({len(received_data)} bytes)\033[0m")
 
-	if len(received_data) > 0:
+	if len(received_data) > 6 and received_data.endswith(FRAME_END):
 
 		b1 = received_data[4]
 		b2 = received_data[6]
@@ -91,34 +155,45 @@ def get_reader_status(port):
 	else:
 		logger(f"\033[91mNo data was received.\033[0m")
 
-def process_bytes(input_bytes: bytes) -> bytes:
+def write_tag_file(path, content):
 	"""
-	Processes a bytes object, unpacking 6-bit chunks into 8-bit bytes.
+	Writes a small file in one go using the raw os API, skipping the
+	buffered Python file object.
 	"""
-	output = []
-	bit_buffer = 0      # Will hold bits temporarily
-	bits_in_buffer = 0  # Number of bits currently in buffer
+	fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+	try:
+		os.write(fd, content.encode())
+	finally:
+		os.close(fd)
 
-	# Iterating over a 'bytes' object gives you integers
-	for byte in input_bytes:
-		# Keep only the lower 6 bits
-		byte &= 0x3F
+def seen_recently(recent_tags, tag, now):
+	"""
+	Records a tag read and tells whether the same tag was already read
+	within DEDUP_WINDOW_SECONDS. The timestamp is refreshed on every read,
+	so a tag sitting in front of the reader keeps being suppressed.
+
+	Args:
+		recent_tags: An OrderedDict of tag -> last seen time, oldest first.
+		tag: The decoded tag.
+		now: The time of the read.
 
-		# Shift the buffer left 6 bits and OR the new 6 bits in
-		bit_buffer = (bit_buffer << 6) | byte
-		bits_in_buffer += 6
+	Returns:
+		True if the read is a repeat and should not be stored again.
+	"""
+	last_seen = recent_tags.pop(tag, None)
+	recent_tags[tag] = now
 
-		# While we have enough bits for a full byte
-		while bits_in_buffer >= 8:
-			# Extract the top 8 bits
-			bits_in_buffer -= 8
-			output_byte = (bit_buffer >> bits_in_buffer) & 0xFF
-			output.append(output_byte)
+	# Entries are ordered by last seen time, so stale ones are at the front
+	while recent_tags and next(iter(recent_tags.values())) < now - DEDUP_FORGET_SECONDS:
+		recent_tags.popitem(last=False)
 
-	# We ignore any leftover bits < 8 at the end
+	return last_seen is not None and now - last_seen < DEDUP_WINDOW_SECONDS
 
-	# Convert the list of integers back into a bytes object
-	return bytes(output)
+def process_bytes(input_bytes: bytes) -> bytes:
+	"""
+	Processes a bytes object, unpacking 6-bit chunks into 8-bit bytes.
+	"""
+	return unpack_6bit_to_8bit(input_bytes)
 
 def unpack_6bit_to_8bit(input_bytes: bytes) -> bytes:
 	"""
@@ -138,100 +213,43 @@ def unpack_6bit_to_8bit(input_bytes: bytes) -> bytes:
 	Returns:
 		A 'bytes' object with the data repacked into 8-bit bytes.
 	"""
-	bit_buffer = 0       # An integer to act as a bit-stream buffer
-	buffer_length = 0    # How many bits are currently in the buffer
-	output_bytes = bytearray()  # A mutable list of bytes for our output
-
-	#
-	# This visualization shows how bits are masked and combined.
-	# We mask with 0x3F (0b00111111) to get the 6 data bits, then
-	# shift the buffer left by 6 to make room for the new bits.
+	# Let a single Python int hold the whole bitstream. Shifting big ints
+	# is done in C, so this is one tight loop plus one native to_bytes()
+	# call.
+	bit_buffer = 0  # An integer to act as a bit-stream buffer
 
 	for byte in input_bytes:
-		# 1. Get the 6 significant bits by masking with 0x3F (0b00111111).
-		# This effectively removes the '00' padding on the left.
-		# Example: 0b00110101 & 0b00111111 = 0b00110101 (which is 110101)
-		six_bits = byte & 0x3F
-
-		# 2. Add these 6 bits to our buffer.
-		# We shift the existing buffer left by 6 to make room,
-		# then 'or' the new 6 bits in.
-		bit_buffer = (bit_buffer << 6) | six_bits
-		buffer_length += 6  # We've added 6 bits
-
-		# 3. While the buffer has enough bits to make one or more
-		#    full 8-bit bytes, extract them.
-		while buffer_length >= 8:
-			# We need to extract the *top* 8 bits from the buffer.
-			# To do this, we shift the buffer right so the 8 bits
-			# we want are at the far right.
-			shift_amount = buffer_length - 8
-			new_byte = (bit_buffer >> shift_amount) & 0xFF  # 0xFF is a mask for 8 bits
-
-			# 4. Add the new 8-bit byte to our output
-			output_bytes.append(new_byte)
-
-			# 5. Remove the 8 bits we just extracted from the buffer.
-			# We create a 'mask' for the bits we want to *keep*.
-			# (1 << shift_amount) - 1 creates a mask of 'shift_amount' ones.
-			# Example: if shift_amount is 4, (1 << 4) = 16, 16-1 = 15 = 0b1111
-			mask = (1 << shift_amount) - 1
-			bit_buffer = bit_buffer & mask  # Keep only the leftover bits
-
-			# 6. Update the buffer length
-			buffer_length -= 8
-
-	# The loop is done. Any remaining bits in bit_buffer (if buffer_length < 8)
-	# are discarded as they don't form a full byte.
-
-	return bytes(output_bytes)
-
-
-def bits_to_int(bit_array, start_bit, end_bit):
+		# Mask with 0x3F (0b00111111) to remove the '00' padding on the left,
+		# then shift the buffer left by 6 to make room and 'or' the new bits in.
+		bit_buffer = (bit_buffer << 6) | (byte & 0x3F)
+
+	# Drop the leftover bits at the end that don't form a full byte
+	total_bits = 6 * len(input_bytes)
+	usable_bits = total_bits & ~7
+	bit_buffer >>= total_bits - usable_bits
+
+	return bit_buffer.to_bytes(usable_bits // 8, 'big')
+
+
+def bits_to_int(input_bytes: bytes, start_bit, end_bit):
 	"""
-	Converts a slice of a boolean array (bits) into an integer.
+	Extracts a range of bits from a byte string as an integer.
 	The bits are read from left to right (MSB to LSB).
 	Indices are 0-based. start_bit is inclusive, end_bit is exclusive.
 	"""
-	if start_bit >= end_bit or end_bit > len(bit_array):
-		return 0
+	total_bits = 8 * len(input_bytes)
 
-	number = 0
-	slice_len = end_bit - start_bit
-	for i in range(slice_len):
-		# The bit to check is at index start_bit + i
-		if bit_array[start_bit + i]:
-			# Add the corresponding power of 2
-			# (slice_len - 1 - i) calculates the bit's positional value
-			power = (slice_len - 1 - i)
-			number += (1 << power) # 1 << power is equivalent to 2**power
+	if start_bit >= end_bit or end_bit > total_bits:
+		return 0
 
-	return number
+	# Treat the whole string as one big-endian integer, then shift the
+	# wanted slice down to the LSB and mask off everything above it
+	value = int.from_bytes(input_bytes, 'big')
+	return (value >> (total_bits - end_bit)) & ((1 << (end_bit - start_bit)) - 1)
 
 def car_number(input_bytes: bytes):
-	# --- 1. Convert byte string to a single array of bits ---
-	# We create a list of booleans, where True=1 and False=0.
-	bit_array = []
-	for byte in input_bytes:
-		# Iterate from the most significant bit (MSB) to the LSB
-		for i in range(7, -1, -1):
-			bit = (byte >> i) & 1
-			bit_array.append(bit == 1)
-
-	# --- 2. Define the extraction range (0-based) ---
-	# You want bits "26 through 45" inclusive, assuming the string starts at bit 0.
-	start_index = 26
-	end_index = 45 # inclusive
-
-	# The bits_to_int function uses an exclusive end bit, so we add 1.
-	call_start_bit = start_index
-	call_end_bit = end_index + 1
-	num_bits = call_end_bit - call_start_bit
-
-	# --- 3. Extract the bits ---
-	extracted_value = bits_to_int(bit_array, call_start_bit, call_end_bit)
-
-	return extracted_value
+	# Bits 26 through 45 inclusive (20 bits), counting from bit 0
+	return bits_to_int(input_bytes, 26, 46)
 
 def decode_c1(n1):
 	"""
@@ -253,32 +271,13 @@ def decode_c2_c4(n):
 		return chr(n + 64) # 1 -> 'A' (65)
 	return '?'
 
-def car_owner(input_bytes: bytes):
-	# --- 1. Convert byte string to a single array of bits ---
-	# We create a list of booleans, where True=1 and False=0.
-	bit_array = []
-	for byte in input_bytes:
-		# Iterate from the most significant bit (MSB) to the LSB
-		for i in range(7, -1, -1):
-			bit = (byte >> i) & 1
-			bit_array.append(bit == 1)
-
-	# --- 2. Define the extraction range (0-based) ---
-	# You want bits "7 through 25" inclusive, assuming the string starts at bit 0.
-	start_index = 7
-	end_index = 25 # inclusive
-
-	# The bits_to_int function uses an exclusive end bit, so we add 1.
-	call_start_bit = start_index
-	call_end_bit = end_index + 1
-	num_bits = call_end_bit - call_start_bit
-
-	# --- 3. Extract the bits as a single decimal "Value" ---
-	# This is the "Value" from your decoding formula
-	value = bits_to_int(bit_array, call_start_bit, call_end_bit)
-
-	# --- 5. Decode "Value" using the mixed-base-27 formula ---
-
+@lru_cache(maxsize=4096)
+def decode_owner(value):
+	"""
+	Decodes the 19-bit "Value" into the 4 character Equipment Initial using
+	the mixed-base-27 formula. A yard only ever sees a handful of owners, so
+	the results are cached.
+	"""
 	# Define the powers of 27
 	POW_27_3 = 27**3  # 19683
 	POW_27_2 = 27**2  # 729
@@ -307,107 +306,233 @@ def car_owner(input_bytes: bytes):
 
 	return f"{c1}{c2}{c3}{c4}"
 
+def car_owner(input_bytes: bytes):
+	# --- 1. Extract bits 7 through 25 inclusive (19 bits) as a single decimal "Value" ---
+	# This is the "Value" from your decoding formula
+	value = bits_to_int(input_bytes, 7, 26)
 
-###############################################################################
-## MAIN
-###############################################################################
+	# --- 2. Decode "Value" using the mixed-base-27 formula ---
+	return decode_owner(value)
 
-# Get TTY
-tty = find_ttyusb_port_path()
-
-if not tty:
-	logger(f"\033[91mNo USB tty found. Exiting...\033[0m")
-	exit()
-
-# Connect to serial port
-try:
-	port = serial.Serial(
-		port=f"/dev/{tty}",
-		baudrate=57600,
-		parity=serial.PARITY_NONE,
-		stopbits=serial.STOPBITS_ONE,
-		bytesize=serial.EIGHTBITS,
-		timeout=10
-	)
-
-except serial.SerialException as connect_error:
-	logger(f"\033[91mError: Could not open serial port '{port}'.\033[0m")
-	logger(f"\033[91mDetails: {connect_error}\033[0m")
-except Exception as e:
-	logger(f"\033[91mAn unexpected error occurred: {e}\033[0m")
-
-if not port:
-	logger(f"\033[91mSerial port connection failed. Exiting...\033[0m")
-	exit()
-
-#
-# Send commands to the reader
-#
-
-# Turn RF off
-logger(f"\033[92mTurning RF off.\033[0m")
-send_binary_to_serial(port=port, binary_data=b'\xFA\x00\x05\x7B\xF5')
-received_data = port.read_all()
-logger(f"\033[90mReceived data: {received_data.hex()} ({len(received_data)} bytes)\033[0m")
-
-# Tell reader to use serial
-logger(f"\033[92mSetting reader for serial coms.\033[0m")
-send_binary_to_serial(port=port, binary_data=b'\xFA\x00\x43\x5A\x01\x62\xF5')
-received_data = port.read_all()
-logger(f"\033[90mReceived data: {received_data.hex()} ({len(received_data)} bytes)\033[0m")
-
-# Set RF to 100%
-logger(f"\033[92mSetting RF to 100%.\033[0m")
-send_binary_to_serial(port=port, binary_data=b'\xFA\x00\x0C\x64\x10\xF5')
-received_data = port.read_all()
-logger(f"\033[90mReceived data: {received_data.hex()} ({len(received_data)} bytes)\033[0m")
-
-# Turn RF on
-logger(f"\033[92mTurning RF on.\033[0m")
-send_binary_to_serial(port=port, binary_data=b'\xFA\x00\x0A\x76\xF5')
-received_data = port.read_all()
-logger(f"\033[90mReceived data: {received_data.hex()} ({len(received_data)} bytes)\033[0m")
+def configure_reader(port):
+	"""
+	Sends the start-up commands to the reader: RF off, serial coms,
+	RF power 100% and RF back on.
+	"""
+	# Turn RF off
+	logger(f"\033[92mTurning RF off.\033[0m")
+	send_binary_to_serial(port=port, binary_data=b'\xFA\x00\x05\x7B\xF5')
+	received_data = read_reply(port)
+	logger(f"\033[90mReceived data: {received_data.hex()} ({len(received_data)} bytes)\033[0m")
 
-# Globals
-last_tag = ''
-last_read = time.time()
+	# Tell reader to use serial
+	logger(f"\033[92mSetting reader for serial coms.\033[0m")
+	send_binary_to_serial(port=port, binary_data=b'\xFA\x00\x43\x5A\x01\x62\xF5')
+	received_data = read_reply(port)
+	logger(f"\033[90mReceived data: {received_data.hex()} ({len(received_data)} bytes)\033[0m")
 
-# Start reading
-logger(f"\033[93mEntering read loop.\033[0m")
-while True:
-	received_data = port.readline()
+	# Set RF to 100%
+	logger(f"\033[92mSetting RF to 100%.\033[0m")
+	send_binary_to_serial(port=port, binary_data=b'\xFA\x00\x0C\x64\x10\xF5')
+	received_data = read_reply(port)
+	logger(f"\033[90mReceived data: {received_data.hex()} ({len(received_data)} bytes)\033[0m")
+
+	# Turn RF on
+	logger(f"\033[92mTurning RF on.\033[0m")
+	send_binary_to_serial(port=port, binary_data=b'\xFA\x00\x0A\x76\xF5')
+	received_data = read_reply(port)
+	logger(f"\033[90mReceived data: {received_data.hex()} ({len(received_data)} bytes)\033[0m")
 
-	if len(received_data) > 0:
-		last_read = time.time()
-		logger(f"\033[90mRaw read: {received_data.hex()}\033[0m")
+def open_reader():
+	"""
+	Finds the USB serial converter, opens it and configures the reader.
 
-		# Extract the needed bytes
-		pattern = re.compile(b'\xfa\x00\x07(.*?)\xf5', re.DOTALL)
-		matches = pattern.findall(received_data)
+	Returns:
+		serial.Serial or None: The configured port, or None if the reader
+							   could not be found or opened.
+	"""
+	# Get TTY
+	tty = find_ttyusb_port_path()
+
+	if not tty:
+		logger(f"\033[91mNo USB tty found.\033[0m")
+		return None
+
+	# Connect to serial port
+	port = None
+
+	try:
+		port = serial.Serial(
+			port=f"/dev/{tty}",
+			baudrate=57600,
+			parity=serial.PARITY_NONE,
+			stopbits=serial.STOPBITS_ONE,
+			bytesize=serial.EIGHTBITS,
+			timeout=READ_TIMEOUT_SECONDS
+		)
+
+		# Send commands to the reader
+		configure_reader(port)
+
+	except serial.SerialException as connect_error:
+		logger(f"\033[91mError: Could not open serial port '/dev/{tty}'.\033[0m")
+		logger(f"\033[91mDetails: {connect_error}\033[0m")
+	except Exception as e:
+		logger(f"\033[91mAn unexpected error occurred: {e}\033[0m")
+	else:
+		return port
+
+	# Don't leave a half configured port open
+	if port:
+		port.close()
+
+	return None
+
+def reconnect_reader(port):
+	"""
+	Closes a port that stopped working and keeps trying to open the reader
+	again, backing off exponentially up to RECONNECT_MAX_DELAY_SECONDS.
+
+	Args:
+		port: The failed port, or None if there is nothing to close.
+
+	Returns:
+		serial.Serial: The newly opened and configured port.
+	"""
+	if port:
+		try:
+			port.close()
+		except Exception:
+			pass
+
+	delay = RECONNECT_INITIAL_DELAY_SECONDS
+
+	while True:
+		logger(f"\033[93mReconnecting to the reader in {delay} seconds.\033[0m")
+		time.sleep(delay)
+
+		port = open_reader()
+
+		if port:
+			logger(f"\033[92mReconnected to the reader.\033[0m")
+			return port
+
+		delay = min(delay * 2, RECONNECT_MAX_DELAY_SECONDS)
+
+def process_reads(read_queue, tags_log):
+	"""
+	Decodes the raw reads queued by the serial loop and stores the tags.
+	Runs on its own thread so decoding and file I/O never hold up reading
+	the next frame from the serial port.
+
+	Args:
+		read_queue: A queue of (read time, raw data) tuples.
+		tags_log: The open tags log file.
+	"""
+	recent_tags = OrderedDict()
 
-		for i, raw_packet in enumerate(matches):
+	while True:
+		last_read, received_data = read_queue.get()
+
+		# Extract the needed bytes
+		for i, match in enumerate(TAG_PACKET_RE.finditer(received_data)):
+			raw_packet = match.group(1)
 			logger(f"\033[90mFound pattern: {raw_packet.hex()}\033[0m")
 
-			unpacked = unpack_6bit_to_8bit(raw_packet)
-			owner = car_owner(unpacked)
-			number = car_number(unpacked)
-			current_tag = f"{owner} {number}"
+			# A bad packet or a failed write must not take the decoder down
+			try:
+				unpacked = unpack_6bit_to_8bit(raw_packet)
+				owner = car_owner(unpacked)
+				number = car_number(unpacked)
+				current_tag = f"{owner} {number}"
+
+				logger(f"\033[90mFound tag: {current_tag}\033[0m")
 
-			logger(f"\033[90mFound tag: {current_tag}\033[0m")
+				tags_log.write(f"{last_read},{current_tag}\n")
 
-			with open("/tmp/tags.log", 'a') as file:
-				file.write(f"{last_read},{current_tag}\n")
+				if not seen_recently(recent_tags, current_tag, last_read):
+					logger(f"\033[92mStoring tag for sending to the recipients\033[0m")
 
-			if last_tag != current_tag:
-				last_tag = current_tag
-				logger(f"\033[92mStoring tag for sending to the recipients\033[0m")
+					write_tag_file(os.path.join(TAG_DIR, f"{last_read}-{i}.tag"), f"{current_tag}\n")
 
-				with open(f"/dev/shm/{last_read}-{i}.tag", 'w') as file:
-					file.write(f"{current_tag}\n")
+			except Exception as e:
+				logger(f"\033[91mError while storing packet {raw_packet.hex()}: {e}\033[0m")
 
-		# Got a read, no need for status check
-		continue
 
-	# No reads received, let's get reader's status
-	time.sleep(0.1)
-	get_reader_status(port)
+###############################################################################
+## MAIN
+###############################################################################
+
+# Connect to the reader, waiting for it if the converter is not there yet
+port = open_reader() or reconnect_reader(None)
+
+# Keep the log open for the lifetime of the process, line buffered so
+# tailing it still shows every read right away
+tags_log = open(TAGS_LOG_PATH, 'a', buffering=1)
+atexit.register(tags_log.close)
+
+# Raw reads are decoded and stored on a separate thread
+read_queue = queue.Queue(maxsize=READ_QUEUE_SIZE)
+decoder = threading.Thread(target=process_reads, args=(read_queue, tags_log), name="tag-decoder", daemon=True)
+decoder.start()
+
+# Globals
+last_read = time.time()
+last_status = time.time()
+remainder = b''
+
+# Start reading
+logger(f"\033[93mEntering read loop.\033[0m")
+while True:
+	try:
+		# Blocks until a full frame arrives or the read times out
+		previous_remainder = remainder
+		received_data, remainder = read_frame(port, remainder)
+
+		if len(received_data) > 0:
+			last_read = time.time()
+			logger(f"\033[90mRaw read: {received_data.hex()}\033[0m")
+
+			# Hand the read over to the decoder
+			try:
+				read_queue.put_nowait((last_read, received_data))
+			except queue.Full:
+				logger(f"\033[91mDecoder is falling behind, waiting for room in the queue.\033[0m")
+
+				while True:
+					try:
+						read_queue.put((last_read, received_data), timeout=1)
+						break
+					except queue.Full:
+						# Exit so systemd restarts us instead of hanging here forever
+						if not decoder.is_alive():
+							logger(f"\033[91mDecoder thread died. Exiting...\033[0m")
+							exit(1)
+
+			# Got a read, no need for status check
+			continue
+
+		# A partial frame gets one more read to complete, if nothing was
+		# added it is noise and must not hold back the status checks
+		if remainder and len(remainder) == len(previous_remainder):
+			logger(f"\033[91mDropping {len(remainder)} bytes without a frame end: {remainder.hex()}\033[0m")
+			remainder = b''
+
+		# Part of a frame arrived, the rest comes with the next read
+		if remainder:
+			if len(remainder) > MAX_FRAME_BYTES:
+				logger(f"\033[91mDropping {len(remainder)} bytes without a frame end: {remainder.hex()}\033[0m")
+				remainder = b''
+
+			continue
+
+		# No reads received, let's get reader's status every now and then
+		if time.time() - last_status >= STATUS_INTERVAL_SECONDS:
+			get_reader_status(port)
+			last_status = time.time()
+
+	except serial.SerialException as read_error:
+		# Most likely the USB converter went away, find it and start over
+		logger(f"\033[91mLost connection to the reader: {read_error}\033[0m")
+		port = reconnect_reader(port)
+		remainder = b''